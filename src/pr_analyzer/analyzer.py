@@ -1,10 +1,19 @@
 """Analyze PR data and calculate statistics."""
 
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from itertools import compress
 from pathlib import Path
 from typing import cast
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+from pyarrow import feather as pa_feather
+
+from . import __version__
 
 
 # Default timezone (JST)
@@ -29,96 +38,264 @@ def process_pr_data(
     Returns:
         DataFrame with processed PR data
     """
-    filtered_prs = []
-
-    for pr in prs:
-        created_at = datetime.fromisoformat(
-            pr["createdAt"].replace("Z", "+00:00")
-        ).astimezone(tz)
-
-        if (cutoff_date is None or created_at >= cutoff_date) and (
-            end_date is None or created_at <= end_date
-        ):
-            pr_data = {
-                "number": pr["number"],
-                "title": pr["title"],
-                "author": pr["author"]["login"] if pr["author"] else "unknown",
-                "created_at": created_at.isoformat(),
-                "merged_at": None,
-                "state": pr["state"],
-                "month": created_at.strftime("%Y-%m"),
-                "year": created_at.year,
-                "time_to_merge_hours": None,
-                "time_to_merge_days": None,
-            }
-
-            # Calculate time to merge if merged
-            if pr["mergedAt"]:
-                merged_at = datetime.fromisoformat(
-                    pr["mergedAt"].replace("Z", "+00:00")
-                ).astimezone(tz)
-                pr_data["merged_at"] = merged_at.isoformat()
-                time_to_merge_hours = (merged_at - created_at).total_seconds() / 3600
-                pr_data["time_to_merge_hours"] = time_to_merge_hours
-                pr_data["time_to_merge_days"] = time_to_merge_hours / 24
-
-            # Add diff stats if available
-            if "additions" in pr:
-                pr_data["additions"] = pr["additions"]
-                pr_data["deletions"] = pr["deletions"]
-                pr_data["changed_files"] = pr["changedFiles"]
-                pr_data["total_changes"] = pr["additions"] + pr["deletions"]
-
-            filtered_prs.append(pr_data)
-
-    df = pd.DataFrame(filtered_prs)
-    df["created_at"] = pd.to_datetime(df["created_at"])
-
-    return df
+    # Parse creation timestamps first so PRs outside the date range are dropped
+    # before any other field is extracted.
+    created_at = pd.to_datetime(
+        pd.Series([pr["createdAt"] for pr in prs]),
+        utc=True,
+        format="ISO8601",
+    )
+
+    # Filter on int64 epoch nanoseconds instead of tz-aware datetime comparisons
+    created_ns = (
+        created_at.dt.tz_localize(None).to_numpy(dtype="datetime64[ns]").view("int64")
+    )
+    mask = np.ones(len(prs), dtype=bool)
+    if cutoff_date is not None:
+        mask &= created_ns >= pd.Timestamp(cutoff_date).value
+    if end_date is not None:
+        mask &= created_ns <= pd.Timestamp(end_date).value
+
+    kept_prs = list(compress(prs, mask))
+    created_at = created_at.loc[mask].reset_index(drop=True).dt.tz_convert(tz)
+
+    # Build column lists directly rather than letting pandas walk every PR dict
+    fields = ["number", "title", "mergedAt", "state"]
+    if kept_prs and "additions" in kept_prs[0]:
+        fields.extend(["additions", "deletions", "changedFiles"])
+
+    columns = {field: [pr[field] for pr in kept_prs] for field in fields}
+    columns["author"] = [
+        pr["author"]["login"] if pr["author"] else "unknown" for pr in kept_prs
+    ]
+    raw = pd.DataFrame(columns)
+
+    merged_at = pd.to_datetime(
+        raw["mergedAt"], utc=True, format="ISO8601"
+    ).dt.tz_convert(tz)
+
+    # Calculate time to merge (NaN for unmerged PRs)
+    time_to_merge_hours = (merged_at - created_at).dt.total_seconds() / 3600
+
+    # Truncate local wall-clock datetime64 values to months; this matches
+    # strftime("%Y-%m") without formatting every timestamp in Python
+    months = (
+        created_at.dt.tz_localize(None)
+        .to_numpy(dtype="datetime64[ns]")
+        .astype("datetime64[M]")
+        .astype(str)
+    )
+
+    df = pd.DataFrame(
+        {
+            "number": raw["number"],
+            "title": raw["title"],
+            "author": raw["author"],
+            "created_at": created_at,
+            "merged_at": merged_at,
+            "state": raw["state"],
+            "month": months,
+            "year": created_at.dt.year,
+            "time_to_merge_hours": time_to_merge_hours,
+            "time_to_merge_days": time_to_merge_hours / 24,
+        }
+    )
+
+    # Add diff stats if available
+    if "additions" in raw.columns:
+        df["additions"] = raw["additions"]
+        df["deletions"] = raw["deletions"]
+        df["changed_files"] = raw["changedFiles"]
+        df["total_changes"] = raw["additions"] + raw["deletions"]
+
+    # Shrink dtypes: counts fit in narrower ints, repeated strings in categories
+    for column in (
+        "number",
+        "year",
+        "additions",
+        "deletions",
+        "changed_files",
+        "total_changes",
+    ):
+        if column in df.columns:
+            df[column] = pd.to_numeric(df[column], downcast="integer")
+    for column in ("author", "state", "month"):
+        df[column] = df[column].astype("category")
+    # Titles are mostly unique, so store them in Arrow string buffers instead
+    df["title"] = df["title"].astype("string[pyarrow]")
+
+    return df.reset_index(drop=True)
+
+
+# Schema metadata key holding the digest of the raw input a cache was built from
+CACHE_INPUT_DIGEST_KEY = b"pr_analyzer.input_sha256"
+
+
+def get_processed_cache_path(
+    cache_dir: str | Path,
+    cutoff_date: datetime | None = None,
+    end_date: datetime | None = None,
+    tz: timezone = DEFAULT_TIMEZONE,
+) -> Path:
+    """
+    Build the Feather cache path for processed PR data.
 
+    The file name covers only the date filters, the timezone and the package
+    version, so each setting keeps a single cache file that is overwritten
+    when the input changes rather than piling up stale files.
 
-def calculate_monthly_statistics(df: pd.DataFrame) -> pd.DataFrame:
+    Args:
+        cache_dir: Directory to store the cache file in
+        cutoff_date: Filter PRs created after this date
+        end_date: Filter PRs created before this date
+        tz: Timezone for date conversion (default: JST/UTC+9)
+
+    Returns:
+        Path to the cache file
     """
-    Calculate monthly statistics from PR data.
+    key = f"{__version__}|{cutoff_date}|{end_date}|{tz}"
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    return Path(cache_dir) / f".cache_{digest}.feather"
+
+
+def get_input_digest(input_file: str | Path) -> str:
+    """
+    Hash the contents of a raw PR data file.
 
     Args:
-        df: DataFrame with PR data
+        input_file: Raw PR data JSON file
 
     Returns:
-        DataFrame with monthly statistics
+        Hex SHA-256 digest of the file contents
     """
-    # Filter only merged PRs
-    df_merged = cast(pd.DataFrame, df[df["time_to_merge_days"].notna()].copy())
+    return hashlib.sha256(Path(input_file).read_bytes()).hexdigest()
 
-    monthly_data = {}
 
-    for month in df_merged["month"].unique():
-        month_prs = cast(pd.DataFrame, df_merged[df_merged["month"] == month])
+def read_processed_cache(cache_path: Path, input_digest: str) -> pd.DataFrame | None:
+    """
+    Read processed PR data from a Feather cache built from the same input.
 
-        stats = {
-            "month": month,
-            "merged_pr_count": len(month_prs),
-            "avg_time_to_merge_hours": month_prs["time_to_merge_hours"].mean(),
-            "avg_time_to_merge_days": month_prs["time_to_merge_hours"].mean() / 24,
-            "unique_authors": month_prs["author"].nunique(),
-        }
+    Args:
+        cache_path: Cache file path
+        input_digest: Digest of the raw input file (see get_input_digest)
 
-        # Calculate PRs per person
-        stats["avg_prs_per_person"] = (
-            stats["merged_pr_count"] / stats["unique_authors"]
-            if stats["unique_authors"] > 0
-            else 0
-        )
+    Returns:
+        Cached DataFrame, or None if there is no cache for this input
+    """
+    if not cache_path.exists():
+        return None
+    table = pa_feather.read_table(cache_path)
+    metadata = table.schema.metadata or {}
+    if metadata.get(CACHE_INPUT_DIGEST_KEY) != input_digest.encode():
+        return None
+    return table.to_pandas()
+
+
+def write_processed_cache(
+    df: pd.DataFrame, cache_path: Path, input_digest: str
+) -> None:
+    """
+    Write processed PR data to a Feather cache tagged with its input digest.
+
+    Args:
+        df: Processed PR data
+        cache_path: Cache file path
+        input_digest: Digest of the raw input file (see get_input_digest)
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = {**(table.schema.metadata or {}), CACHE_INPUT_DIGEST_KEY: input_digest}
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    pa_feather.write_feather(table.replace_schema_metadata(metadata), cache_path)
+
+
+def calculate_monthly_statistics(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Calculate monthly statistics from PR data.
+
+    Args:
+        df: DataFrame with PR data
 
-        # Add diff stats if available
-        if "total_changes" in month_prs.columns:
-            stats["median_total_changes"] = month_prs["total_changes"].median()
-            stats["median_changed_files"] = month_prs["changed_files"].median()
+    Returns:
+        DataFrame with monthly statistics
+    """
+    # Filter only merged PRs, keeping just the columns the statistics need
+    columns = [
+        column
+        for column in (
+            "month",
+            "author",
+            "time_to_merge_hours",
+            "total_changes",
+            "changed_files",
+        )
+        if column in df.columns
+    ]
+    df_merged = cast(pd.DataFrame, df.loc[df["time_to_merge_days"].notna(), columns])
+
+    # Sort once by (month, author) so each month is a contiguous segment and
+    # repeated authors within a month sit next to each other
+    month_codes, months = pd.factorize(df_merged["month"], sort=True)
+    author_codes, authors = pd.factorize(df_merged["author"])
+    sort_key = month_codes.astype(np.int64) * len(authors) + author_codes
+    order = np.argsort(sort_key)
+    sort_key = sort_key[order]
+    month_codes = month_codes[order]
+
+    is_new_month = np.ones(len(order), dtype=bool)
+    is_new_month[1:] = month_codes[1:] != month_codes[:-1]
+    starts = np.flatnonzero(is_new_month)
+    counts = np.diff(np.append(starts, len(order)))
+
+    is_new_author = np.ones(len(order), dtype=bool)
+    is_new_author[1:] = sort_key[1:] != sort_key[:-1]
+
+    hours = df_merged["time_to_merge_hours"].to_numpy(dtype=np.float64)[order]
+    if len(order):
+        hours_sum = np.add.reduceat(hours, starts)
+        unique_authors = np.add.reduceat(is_new_author.astype(np.int64), starts)
+    else:
+        hours_sum = np.empty(0)
+        unique_authors = np.empty(0, dtype=np.int64)
+
+    avg_time_to_merge_hours = hours_sum / counts
+    monthly_data = {
+        # Plain strings, so unused categories of the PR frame's month column
+        # do not leak into the result as phantom months
+        "month": np.asarray(months, dtype=object),
+        "merged_pr_count": counts,
+        "avg_time_to_merge_hours": avg_time_to_merge_hours,
+        "avg_time_to_merge_days": avg_time_to_merge_hours / 24,
+        "unique_authors": unique_authors,
+        "avg_prs_per_person": counts / unique_authors,
+    }
+
+    # Add diff stats if available
+    if "total_changes" in df_merged.columns:
+        bounds = list(zip(starts, starts + counts, strict=True))
+        for column in ("total_changes", "changed_files"):
+            values = df_merged[column].to_numpy()[order]
+            monthly_data[f"median_{column}"] = np.array(
+                [np.median(values[start:stop]) for start, stop in bounds],
+                dtype=np.float64,
+            )
+
+    return pd.DataFrame(monthly_data)
+
+
+def write_csv(df: pd.DataFrame, path: Path) -> None:
+    """
+    Write a DataFrame to CSV using Arrow's C++ CSV writer.
 
-        monthly_data[month] = stats
+    Unlike DataFrame.to_csv, headers and strings are always quoted,
+    timestamps carry microseconds and a "+0900"-style offset, and whole
+    floats are written without ".0".
 
-    monthly_df = pd.DataFrame(monthly_data.values())
-    return monthly_df.sort_values("month").reset_index(drop=True)
+    Args:
+        df: DataFrame to write
+        path: Output CSV path
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pa_csv.write_csv(table, path)
 
 
 def save_statistics(
@@ -127,7 +304,7 @@ def save_statistics(
     output_dir: str | Path = ".",
 ) -> dict[str, Path]:
     """
-    Save statistics to CSV and JSON files.
+    Save statistics to CSV, JSON, and Parquet files.
 
     Args:
         monthly_stats: Monthly statistics DataFrame
@@ -140,25 +317,40 @@ def save_statistics(
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    output_files = {}
-
-    # Save monthly statistics
-    monthly_csv = output_dir / "monthly_statistics.csv"
-    monthly_stats.to_csv(monthly_csv, index=False)
-    output_files["monthly_csv"] = monthly_csv
-
-    monthly_json = output_dir / "monthly_statistics.json"
-    monthly_stats.to_json(monthly_json, orient="records", indent=2)
-    output_files["monthly_json"] = monthly_json
-
-    # Save PR details
-    details_csv = output_dir / "pr_details.csv"
-    pr_details.to_csv(details_csv, index=False)
-    output_files["details_csv"] = details_csv
-
-    details_json = output_dir / "pr_details.json"
-    pr_details.to_json(details_json, orient="records", indent=2)
-    output_files["details_json"] = details_json
+    output_files = {
+        "monthly_csv": output_dir / "monthly_statistics.csv",
+        "monthly_json": output_dir / "monthly_statistics.json",
+        "monthly_parquet": output_dir / "monthly_statistics.parquet",
+        "details_csv": output_dir / "pr_details.csv",
+        "details_json": output_dir / "pr_details.json",
+        "details_parquet": output_dir / "pr_details.parquet",
+    }
+
+    # The files are independent, so overlap the writers (most of their work
+    # runs in C/C++ code that releases the GIL)
+    with ThreadPoolExecutor(max_workers=len(output_files)) as executor:
+        futures = []
+        for df, prefix in ((monthly_stats, "monthly"), (pr_details, "details")):
+            futures.extend(
+                [
+                    executor.submit(write_csv, df, output_files[f"{prefix}_csv"]),
+                    executor.submit(
+                        df.to_json,
+                        output_files[f"{prefix}_json"],
+                        orient="records",
+                        indent=2,
+                    ),
+                    executor.submit(
+                        df.to_parquet,
+                        output_files[f"{prefix}_parquet"],
+                        engine="pyarrow",
+                        compression="zstd",
+                        index=False,
+                    ),
+                ]
+            )
+        for future in futures:
+            future.result()
 
     print("\n✓ Saved statistics:")
     for path in output_files.values():
@@ -1,5 +1,6 @@
 """Command-line interface for PR Analyzer."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -8,8 +9,12 @@ import pandas as pd
 
 from .analyzer import (
     calculate_monthly_statistics,
+    get_input_digest,
+    get_processed_cache_path,
     process_pr_data,
+    read_processed_cache,
     save_statistics,
+    write_processed_cache,
 )
 from .fetcher import fetch_pr_data, load_pr_data
 from .visualizer import create_all_visualizations
@@ -28,6 +33,69 @@ def parse_timezone(tz_offset: int) -> timezone:
     return timezone(timedelta(hours=tz_offset))
 
 
+def load_processed_pr_data(
+    input_file: str | Path,
+    cache_dir: str | Path,
+    cutoff_date: datetime | None,
+    end_date: datetime | None,
+    tz: timezone,
+    use_cache: bool = True,
+) -> pd.DataFrame:
+    """
+    Load processed PR data from the cache, or process the raw PR data file.
+
+    Args:
+        input_file: Raw PR data JSON file
+        cache_dir: Directory holding the processed data cache
+        cutoff_date: Filter PRs created after this date
+        end_date: Filter PRs created before this date
+        tz: Timezone for date conversion
+        use_cache: Whether to read and write the processed data cache
+
+    Returns:
+        DataFrame with processed PR data
+    """
+    cache_path = None
+    input_digest = ""
+    if use_cache:
+        cache_path = get_processed_cache_path(
+            cache_dir, cutoff_date=cutoff_date, end_date=end_date, tz=tz
+        )
+        input_digest = get_input_digest(input_file)
+        df = read_processed_cache(cache_path, input_digest)
+        if df is not None:
+            click.echo(f"✓ Loaded {len(df)} processed PRs from cache: {cache_path}")
+            return df
+
+    prs = load_pr_data(str(input_file))
+    click.echo(f"✓ Loaded {len(prs)} PRs")
+
+    click.echo("\nProcessing PR data...")
+    df = process_pr_data(prs, cutoff_date=cutoff_date, end_date=end_date, tz=tz)
+    click.echo(f"✓ Processed {len(df)} PRs")
+
+    if cache_path is not None:
+        write_processed_cache(df, cache_path, input_digest)
+
+    return df
+
+
+def parse_date(date_str: str | None, tz: timezone) -> datetime | None:
+    """
+    Parse a YYYY-MM-DD date option as midnight in the given timezone.
+
+    Args:
+        date_str: Date string, or None if the option was not given
+        tz: Timezone to attach to the parsed date
+
+    Returns:
+        Timezone-aware datetime, or None if no date was given
+    """
+    if not date_str:
+        return None
+    return datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=tz)
+
+
 @click.group()
 @click.version_option()
 def main():
@@ -62,6 +130,12 @@ def main():
 @click.option(
     "--timeout", default=600, type=int, help="Command timeout in seconds (default: 600)"
 )
+@click.option(
+    "--cache-ttl",
+    default=0,
+    type=int,
+    help="Reuse cached gh output younger than this many seconds (default: 0, off)",
+)
 def fetch(
     repo: str,
     label: str | None,
@@ -71,6 +145,8 @@ def fetch(
     limit: int,
     state: str,
     timeout: int,
+    *,
+    cache_ttl: int,
 ):
     """Fetch PR data from GitHub."""
     try:
@@ -83,6 +159,7 @@ def fetch(
             limit=limit,
             state=state,
             timeout=timeout,
+            cache_ttl=cache_ttl,
         )
         click.echo(f"\n✓ Success! Data saved to: {output_path}")
     except Exception as e:
@@ -109,39 +186,36 @@ def fetch(
     type=int,
     help="UTC offset in hours (default: 9 for JST)",
 )
+@click.option(
+    "--no-cache", is_flag=True, help="Do not read or write the processed data cache"
+)
 def analyze(
     input_file: str,
     output_dir: str,
     cutoff_date: str | None,
     end_date: str | None,
     timezone: int,
+    no_cache: bool,
 ):
     """Analyze PR data and generate statistics."""
     try:
         # Parse timezone
         tz = parse_timezone(timezone)
 
-        # Load data
         click.echo(f"Loading PR data from {input_file}...")
-        prs = load_pr_data(input_file)
-        click.echo(f"✓ Loaded {len(prs)} PRs")
 
-        # Parse cutoff date
-        cutoff = None
-        if cutoff_date:
-            cutoff = datetime.strptime(cutoff_date, "%Y-%m-%d").replace(tzinfo=tz)
+        # Parse date filters
+        cutoff = parse_date(cutoff_date, tz)
+        if cutoff:
             click.echo(f"✓ Filtering PRs after {cutoff_date}")
-
-        # Parse end date
-        end = None
-        if end_date:
-            end = datetime.strptime(end_date, "%Y-%m-%d").replace(tzinfo=tz)
+        end = parse_date(end_date, tz)
+        if end:
             click.echo(f"✓ Filtering PRs before {end_date}")
 
-        # Process data
-        click.echo("\nProcessing PR data...")
-        df = process_pr_data(prs, cutoff_date=cutoff, end_date=end, tz=tz)
-        click.echo(f"✓ Processed {len(df)} PRs")
+        # Load and process data
+        df = load_processed_pr_data(
+            input_file, output_dir, cutoff, end, tz, use_cache=not no_cache
+        )
 
         # Calculate statistics
         click.echo("\nCalculating monthly statistics...")
@@ -161,7 +235,11 @@ def analyze(
 
 @main.command()
 @click.option(
-    "--input", "-i", "input_file", required=True, help="Monthly statistics JSON file"
+    "--input",
+    "-i",
+    "input_file",
+    required=True,
+    help="Monthly statistics JSON or Parquet file",
 )
 @click.option("--output-dir", "-o", default=".", help="Output directory")
 @click.option(
@@ -169,17 +247,42 @@ def analyze(
     default=None,
     help='Repository name to display in title (e.g., "owner/repo")',
 )
-def visualize(input_file: str, output_dir: str, repo: str | None):
+@click.option(
+    "--dpi", default=150, type=int, help="Chart image resolution (default: 150)"
+)
+@click.option(
+    "--format",
+    "output_format",
+    default="png",
+    type=click.Choice(["png", "html"]),
+    help="Overview chart format: static PNG or interactive HTML (default: png)",
+)
+def visualize(
+    input_file: str,
+    output_dir: str,
+    repo: str | None,
+    dpi: int,
+    output_format: str,
+):
     """Generate visualization charts."""
     try:
         # Load monthly statistics
         click.echo(f"Loading monthly statistics from {input_file}...")
-        monthly_stats = pd.read_json(input_file)
+        if Path(input_file).suffix == ".parquet":
+            monthly_stats = pd.read_parquet(input_file)
+        else:
+            monthly_stats = pd.read_json(input_file)
         click.echo(f"✓ Loaded statistics for {len(monthly_stats)} months")
 
         # Create visualizations
         click.echo("\nGenerating visualizations...")
-        create_all_visualizations(monthly_stats, output_dir=output_dir, repo_name=repo)
+        create_all_visualizations(
+            monthly_stats,
+            output_dir=output_dir,
+            repo_name=repo,
+            dpi=dpi,
+            output_format=output_format,
+        )
 
         click.echo("\n✓ Visualization complete!")
 
@@ -223,12 +326,36 @@ def visualize(input_file: str, output_dir: str, repo: str | None):
 @click.option(
     "--timeout", default=600, type=int, help="Command timeout in seconds (default: 600)"
 )
+@click.option(
+    "--cache-ttl",
+    default=0,
+    type=int,
+    help="Reuse cached gh output younger than this many seconds (default: 0, off)",
+)
 @click.option(
     "--timezone",
     default=9,
     type=int,
     help="UTC offset in hours (default: 9 for JST)",
 )
+@click.option(
+    "--dpi", default=150, type=int, help="Chart image resolution (default: 150)"
+)
+@click.option(
+    "--format",
+    "output_format",
+    default="png",
+    type=click.Choice(["png", "html"]),
+    help="Overview chart format: static PNG or interactive HTML (default: png)",
+)
+@click.option(
+    "--no-cache", is_flag=True, help="Do not read or write the processed data cache"
+)
+@click.option(
+    "--sequential",
+    is_flag=True,
+    help="Save statistics and generate charts one after another (ordered output)",
+)
 def run(
     repo: str,
     label: str | None,
@@ -239,7 +366,12 @@ def run(
     limit: int,
     state: str,
     timeout: int,
+    cache_ttl: int,
     timezone: int,
+    dpi: int,
+    output_format: str,
+    no_cache: bool,
+    sequential: bool,
 ):
     """Run complete analysis pipeline (fetch + analyze + visualize)."""
     try:
@@ -263,6 +395,7 @@ def run(
             limit=limit,
             state=state,
             timeout=timeout,
+            cache_ttl=cache_ttl,
         )
 
         # 2. Analyze
@@ -270,37 +403,59 @@ def run(
         click.echo("STEP 2: Analyzing PR data")
         click.echo("=" * 70)
 
-        prs = load_pr_data(str(data_file))
-        click.echo(f"✓ Loaded {len(prs)} PRs")
-
-        # Parse cutoff date
-        cutoff = None
-        if cutoff_date:
-            cutoff = datetime.strptime(cutoff_date, "%Y-%m-%d").replace(tzinfo=tz)
+        # Parse date filters
+        cutoff = parse_date(cutoff_date, tz)
+        if cutoff:
             click.echo(f"✓ Filtering PRs after {cutoff_date}")
-
-        # Parse end date
-        end = None
-        if end_date:
-            end = datetime.strptime(end_date, "%Y-%m-%d").replace(tzinfo=tz)
+        end = parse_date(end_date, tz)
+        if end:
             click.echo(f"✓ Filtering PRs before {end_date}")
 
-        df = process_pr_data(prs, cutoff_date=cutoff, end_date=end, tz=tz)
-        click.echo(f"✓ Processed {len(df)} PRs")
+        df = load_processed_pr_data(
+            data_file, output_dir_path, cutoff, end, tz, use_cache=not no_cache
+        )
 
         monthly_stats = calculate_monthly_statistics(df)
         click.echo(f"✓ Calculated statistics for {len(monthly_stats)} months")
 
-        save_statistics(monthly_stats, df, output_dir=str(output_dir_path))
+        if sequential:
+            save_statistics(monthly_stats, df, output_dir=str(output_dir_path))
 
         # 3. Visualize
         click.echo("\n" + "=" * 70)
         click.echo("STEP 3: Generating visualizations")
         click.echo("=" * 70)
 
-        create_all_visualizations(
-            monthly_stats, output_dir=str(output_dir_path), repo_name=repo
-        )
+        if sequential:
+            create_all_visualizations(
+                monthly_stats,
+                output_dir=str(output_dir_path),
+                repo_name=repo,
+                dpi=dpi,
+                output_format=output_format,
+            )
+        else:
+            # Saving statistics and rendering charts are independent, so overlap
+            # the file writes with chart rendering
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(
+                        save_statistics,
+                        monthly_stats,
+                        df,
+                        output_dir=str(output_dir_path),
+                    ),
+                    executor.submit(
+                        create_all_visualizations,
+                        monthly_stats,
+                        output_dir=str(output_dir_path),
+                        repo_name=repo,
+                        dpi=dpi,
+                        output_format=output_format,
+                    ),
+                ]
+                for future in futures:
+                    future.result()
 
         # Summary
         click.echo("\n" + "=" * 70)
@@ -311,9 +466,11 @@ def run(
         click.echo("  - pr_data_with_diff.json (raw data)")
         click.echo("  - monthly_statistics.csv")
         click.echo("  - monthly_statistics.json")
+        click.echo("  - monthly_statistics.parquet")
         click.echo("  - pr_details.csv")
         click.echo("  - pr_details.json")
-        click.echo("  - pr_analysis_overview.png")
+        click.echo("  - pr_details.parquet")
+        click.echo(f"  - pr_analysis_overview.{output_format}")
 
     except Exception as e:
         click.echo(f"\n✗ Error: {e}", err=True)
@@ -1,10 +1,17 @@
 """Fetch PR data from GitHub."""
 
-import json
+import hashlib
 import re
 import subprocess
+import time
 from pathlib import Path
 
+import orjson
+
+
+# Repository in "owner/repo" format
+REPO_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+$")
+
 
 def validate_repo_format(repo: str) -> None:
     """
@@ -16,8 +23,7 @@ def validate_repo_format(repo: str) -> None:
     Raises:
         ValueError: If repository format is invalid
     """
-    pattern = r"^[a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+$"
-    if not re.match(pattern, repo):
+    if not REPO_PATTERN.match(repo):
         msg = (
             f"Invalid repository format: '{repo}'. "
             "Expected format: 'owner/repo' (e.g., 'octocat/hello-world')"
@@ -34,6 +40,8 @@ def fetch_pr_data(
     limit: int = 10000,
     state: str = "merged",
     timeout: int = 600,
+    *,
+    cache_ttl: int = 0,
 ) -> Path:
     """
     Fetch PR data from GitHub using gh CLI.
@@ -47,6 +55,8 @@ def fetch_pr_data(
         limit: Maximum number of PRs to fetch (default: 10000)
         state: PR state to fetch - "all", "merged", "open", "closed" (default: "merged")
         timeout: Command timeout in seconds (default: 600)
+        cache_ttl: Reuse the raw gh output cached next to the output file if it
+            is younger than this many seconds (default: 0, disabled)
 
     Returns:
         Path to the output JSON file
@@ -106,30 +116,47 @@ def fetch_pr_data(
         print(f"Excluding labels: {', '.join(exclude_labels)}")
     print(f"Command: {' '.join(cmd)}")
 
-    result = subprocess.run(
-        cmd,
-        check=False,
-        capture_output=True,
-        text=True,
-        timeout=timeout,
-    )
+    # Raw gh output is cached per command, so exclude labels can change freely
+    cache_key = hashlib.sha256("\0".join(cmd).encode()).hexdigest()[:16]
+    cache_path = output_path.parent / f".gh_cache_{cache_key}.json"
+
+    if cache_ttl > 0 and cache_path.exists():
+        cache_age = time.time() - cache_path.stat().st_mtime
+    else:
+        cache_age = None
+
+    if cache_age is not None and cache_age < cache_ttl:
+        print(f"✓ Using cached gh output ({cache_age:.0f}s old): {cache_path}")
+        raw_output = cache_path.read_bytes()
+    else:
+        # Keep stdout as bytes so orjson can parse it without an extra decode
+        result = subprocess.run(
+            cmd,
+            check=False,
+            capture_output=True,
+            timeout=timeout,
+        )
+
+        if result.returncode != 0:
+            stderr = result.stderr.decode(errors="replace")
+            raise RuntimeError(f"Failed to fetch PR data: {stderr}")
 
-    if result.returncode != 0:
-        raise RuntimeError(f"Failed to fetch PR data: {result.stderr}")
+        raw_output = result.stdout
+        if cache_ttl > 0:
+            cache_path.write_bytes(raw_output)
 
     # Parse and filter data
-    data = json.loads(result.stdout)
+    data = orjson.loads(raw_output)
 
     # Filter out PRs with excluded labels
     if exclude_labels:
         original_count = len(data)
-        exclude_set = set(exclude_labels)
+        exclude_set = frozenset(exclude_labels)
         data = [
             pr
             for pr in data
-            if not any(
-                label_obj.get("name") in exclude_set
-                for label_obj in pr.get("labels", [])
+            if exclude_set.isdisjoint(
+                label_obj["name"] for label_obj in pr.get("labels", ())
             )
         ]
         filtered_count = original_count - len(data)
@@ -138,8 +165,7 @@ def fetch_pr_data(
         )
 
     # Write to file
-    with output_path.open("w") as f:
-        json.dump(data, f, indent=2)
+    output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
     print(f"✓ Fetched {len(data)} PRs")
     print(f"✓ Saved to {output_path}")
@@ -149,6 +175,4 @@ def fetch_pr_data(
 
 def load_pr_data(file_path: str) -> list[dict]:
     """Load PR data from JSON file."""
-    path = Path(file_path)
-    with path.open() as f:
-        return json.load(f)
+    return orjson.loads(Path(file_path).read_bytes())
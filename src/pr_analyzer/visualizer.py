@@ -2,20 +2,44 @@
 
 from pathlib import Path
 
+import matplotlib as mpl
+
+
+# Use the non-interactive backend; charts are only ever written to files
+mpl.use("Agg")
+
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+import plotly.graph_objects as go
 import seaborn as sns
+from plotly.subplots import make_subplots
 
 
 # Set default style
 sns.set_style("whitegrid")
 
 
+def sort_by_month(monthly_stats: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return monthly statistics in month order without copying sorted input.
+
+    Args:
+        monthly_stats: Monthly statistics DataFrame
+
+    Returns:
+        The input DataFrame, or a sorted copy if it was out of order
+    """
+    if monthly_stats["month"].is_monotonic_increasing:
+        return monthly_stats
+    return monthly_stats.sort_values("month", ignore_index=True)
+
+
 def create_overview_charts(
     monthly_stats: pd.DataFrame,
     output_file: str = "pr_analysis_overview.png",
     repo_name: str | None = None,
+    dpi: int = 150,
 ) -> Path:
     """
     Create overview charts with key metrics.
@@ -24,13 +48,15 @@ def create_overview_charts(
         monthly_stats: Monthly statistics DataFrame
         output_file: Output file path
         repo_name: Repository name to display in title (optional)
+        dpi: Output image resolution (default: 150)
 
     Returns:
         Path to the output file
     """
-    df = monthly_stats.copy()
-    df["month"] = pd.to_datetime(df["month"])
-    df = df.sort_values("month").reset_index(drop=True)
+    df = sort_by_month(monthly_stats)
+
+    # Extract the x values once and plot with matplotlib directly
+    months = pd.to_datetime(df["month"]).to_numpy()
 
     fig, axes = plt.subplots(2, 3, figsize=(20, 12))
 
@@ -45,14 +71,12 @@ def create_overview_charts(
 
     # 1. Merged PR count
     ax1 = axes[0, 0]
-    sns.lineplot(
-        data=df,
-        x="month",
-        y="merged_pr_count",
+    ax1.plot(
+        months,
+        df["merged_pr_count"].to_numpy(),
         marker="o",
         linewidth=2,
         markersize=6,
-        ax=ax1,
         color="#2E86AB",
     )
     ax1.set_title("Monthly Merged PR Count", fontsize=14, fontweight="bold")
@@ -64,21 +88,17 @@ def create_overview_charts(
     # Add trend line
     z = np.polyfit(range(len(df)), df["merged_pr_count"], 1)
     p = np.poly1d(z)
-    ax1.plot(
-        df["month"], p(range(len(df))), "--", alpha=0.5, color="red", label="Trend"
-    )
+    ax1.plot(months, p(range(len(df))), "--", alpha=0.5, color="red", label="Trend")
     ax1.legend(loc="upper left")
 
     # 2. Average time to merge
     ax2 = axes[0, 1]
-    sns.lineplot(
-        data=df,
-        x="month",
-        y="avg_time_to_merge_days",
+    ax2.plot(
+        months,
+        df["avg_time_to_merge_days"].to_numpy(),
         marker="s",
         linewidth=2,
         markersize=6,
-        ax=ax2,
         color="#A23B72",
     )
     ax2.set_title("Average Time to Merge PRs", fontsize=14, fontweight="bold")
@@ -99,25 +119,27 @@ def create_overview_charts(
 
     # 3. Unique authors
     ax3 = axes[1, 0]
-    sns.barplot(
-        data=df, x="month", y="unique_authors", ax=ax3, color="#F18F01", alpha=0.7
+    ax3.bar(
+        np.datetime_as_string(months, unit="M"),
+        df["unique_authors"].to_numpy(),
+        color="#F18F01",
+        alpha=0.7,
     )
     ax3.set_title("Number of Unique Authors per Month", fontsize=14, fontweight="bold")
     ax3.set_xlabel("Month", fontsize=12)
     ax3.set_ylabel("Number of Authors", fontsize=12)
+    ax3.grid(False, axis="x")
     ax3.grid(True, alpha=0.3, axis="y")
     ax3.tick_params(axis="x", rotation=45)
 
     # 4. PRs per person
     ax4 = axes[1, 1]
-    sns.lineplot(
-        data=df,
-        x="month",
-        y="avg_prs_per_person",
+    ax4.plot(
+        months,
+        df["avg_prs_per_person"].to_numpy(),
         marker="D",
         linewidth=2,
         markersize=6,
-        ax=ax4,
         color="#C73E1D",
     )
     ax4.set_title("Average PRs per Person", fontsize=14, fontweight="bold")
@@ -139,14 +161,12 @@ def create_overview_charts(
     # 5. Median total changes (additions + deletions) per month
     ax5 = axes[0, 2]
     if "median_total_changes" in df.columns:
-        sns.lineplot(
-            data=df,
-            x="month",
-            y="median_total_changes",
+        ax5.plot(
+            months,
+            df["median_total_changes"].to_numpy(),
             marker="o",
             linewidth=2,
             markersize=6,
-            ax=ax5,
             color="#00B4D8",
         )
         ax5.set_title("Median Total Changes per Month", fontsize=14, fontweight="bold")
@@ -158,14 +178,12 @@ def create_overview_charts(
     # 6. Median changed files per month
     ax6 = axes[1, 2]
     if "median_changed_files" in df.columns:
-        sns.lineplot(
-            data=df,
-            x="month",
-            y="median_changed_files",
+        ax6.plot(
+            months,
+            df["median_changed_files"].to_numpy(),
             marker="s",
             linewidth=2,
             markersize=6,
-            ax=ax6,
             color="#90BE6D",
         )
         ax6.set_title("Median Changed Files per Month", fontsize=14, fontweight="bold")
@@ -176,17 +194,140 @@ def create_overview_charts(
 
     plt.tight_layout()
     output_path = Path(output_file)
-    plt.savefig(output_path, dpi=300, bbox_inches="tight")
+    # tight_layout() already fits the subplots, so skip the extra
+    # bbox_inches="tight" render pass
+    plt.savefig(output_path, dpi=dpi)
     plt.close()
 
     print(f"✓ Saved overview chart: {output_path}")
     return output_path
 
 
+def create_overview_html(
+    monthly_stats: pd.DataFrame,
+    output_file: str = "pr_analysis_overview.html",
+    repo_name: str | None = None,
+) -> Path:
+    """
+    Create an interactive HTML overview with the same metrics as the PNG charts.
+
+    Args:
+        monthly_stats: Monthly statistics DataFrame
+        output_file: Output file path
+        repo_name: Repository name to display in title (optional)
+
+    Returns:
+        Path to the output file
+    """
+    df = sort_by_month(monthly_stats)
+    months = pd.to_datetime(df["month"]).to_numpy()
+
+    title = f"{repo_name} PRs Analysis" if repo_name else "PRs Analysis"
+
+    fig = make_subplots(
+        rows=2,
+        cols=3,
+        subplot_titles=(
+            "Monthly Merged PR Count",
+            "Average Time to Merge PRs",
+            "Median Total Changes per Month",
+            "Number of Unique Authors per Month",
+            "Average PRs per Person",
+            "Median Changed Files per Month",
+        ),
+    )
+
+    # (row, col, column, y-axis label, marker symbol, color)
+    line_panels = [
+        (1, 1, "merged_pr_count", "Number of Merged PRs", "circle", "#2E86AB"),
+        (1, 2, "avg_time_to_merge_days", "Days to Merge", "square", "#A23B72"),
+        (1, 3, "median_total_changes", "Lines Changed", "circle", "#00B4D8"),
+        (2, 2, "avg_prs_per_person", "PRs per Person", "diamond", "#C73E1D"),
+        (2, 3, "median_changed_files", "Number of Files", "square", "#90BE6D"),
+    ]
+    for row, col, column, ylabel, symbol, color in line_panels:
+        if column not in df.columns:
+            continue
+        fig.add_trace(
+            go.Scatter(
+                x=months,
+                y=df[column].to_numpy(),
+                mode="lines+markers",
+                name=ylabel,
+                line={"color": color, "width": 2},
+                marker={"symbol": symbol, "size": 6},
+            ),
+            row=row,
+            col=col,
+        )
+        fig.update_yaxes(title_text=ylabel, row=row, col=col)
+
+    fig.add_trace(
+        go.Bar(
+            x=months,
+            y=df["unique_authors"].to_numpy(),
+            name="Number of Authors",
+            marker={"color": "#F18F01", "opacity": 0.7},
+        ),
+        row=2,
+        col=1,
+    )
+    fig.update_yaxes(title_text="Number of Authors", row=2, col=1)
+
+    # Trend line and overall averages, as in the PNG overview
+    z = np.polyfit(range(len(df)), df["merged_pr_count"], 1)
+    p = np.poly1d(z)
+    fig.add_trace(
+        go.Scatter(
+            x=months,
+            y=p(range(len(df))),
+            mode="lines",
+            name="Trend",
+            line={"color": "red", "dash": "dash"},
+            opacity=0.5,
+        ),
+        row=1,
+        col=1,
+    )
+    averages = [
+        (1, 2, "avg_time_to_merge_days", "days"),
+        (2, 2, "avg_prs_per_person", "PRs/person"),
+    ]
+    for row, col, column, unit in averages:
+        overall_avg = df[column].mean()
+        fig.add_trace(
+            go.Scatter(
+                x=months,
+                y=np.full(len(df), overall_avg),
+                mode="lines",
+                name=f"Overall avg: {overall_avg:.2f} {unit}",
+                line={"color": "red", "dash": "dash"},
+                opacity=0.5,
+            ),
+            row=row,
+            col=col,
+        )
+
+    fig.update_layout(
+        title={"text": title, "x": 0.5},
+        template="plotly_white",
+        showlegend=False,
+        height=900,
+    )
+
+    output_path = Path(output_file)
+    fig.write_html(output_path, include_plotlyjs="cdn")
+
+    print(f"✓ Saved overview chart: {output_path}")
+    return output_path
+
+
 def create_all_visualizations(
     monthly_stats: pd.DataFrame,
     output_dir: str | Path = ".",
     repo_name: str | None = None,
+    dpi: int = 150,
+    output_format: str = "png",
 ) -> dict[str, Path]:
     """
     Create all visualization charts.
@@ -195,6 +336,8 @@ def create_all_visualizations(
         monthly_stats: Monthly statistics DataFrame
         output_dir: Output directory
         repo_name: Repository name to display in title (optional)
+        dpi: Output image resolution for PNG charts (default: 150)
+        output_format: Chart format - "png" or "html" (default: "png")
 
     Returns:
         Dictionary of output file paths
@@ -205,8 +348,13 @@ def create_all_visualizations(
     output_files = {}
 
     # Overview chart (includes PR size metrics)
-    overview_path = output_dir / "pr_analysis_overview.png"
-    create_overview_charts(monthly_stats, str(overview_path), repo_name=repo_name)
+    overview_path = output_dir / f"pr_analysis_overview.{output_format}"
+    if output_format == "html":
+        create_overview_html(monthly_stats, str(overview_path), repo_name=repo_name)
+    else:
+        create_overview_charts(
+            monthly_stats, str(overview_path), repo_name=repo_name, dpi=dpi
+        )
     output_files["overview"] = overview_path
 
     print("\n✓ Created visualizations:")